@@ -8,6 +8,7 @@ Unlike WebRTC/go2rtc approaches, this uses simple TCP protocols
 which are more reliable across NAT/firewall scenarios.
 """
 
+import asyncio
 import logging
 
 import voluptuous as vol
@@ -53,6 +54,11 @@ async def _async_setup_shared(hass: HomeAssistant, config: dict | None = None) -
     else:
         hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _register_frontend)
 
+    # The event loop belongs to Home Assistant - we can't switch policies (e.g.
+    # uvloop) once it is running, so just report what the TCP client runs on
+    loop = asyncio.get_running_loop()
+    _LOGGER.debug("Event loop: %s.%s", type(loop).__module__, type(loop).__qualname__)
+
     _LOGGER.info("Intercom Native integration loaded (simple + full mode auto-bridge)")
 
 
@@ -1,12 +1,17 @@
 """Async TCP client for Intercom Native protocol."""
 
-MAX_PAYLOAD_SIZE = 2048
-DRAIN_INTERVAL = 10  # Drain every N packets instead of every packet
+MAX_PAYLOAD_SIZE = 2048  # ESP rx buffer limit (MAX_AUDIO_CHUNK), well below the u16 length field
+WRITE_BUFFER_HIGH = 64 * 1024  # Transport pauses writing above this
+WRITE_BUFFER_LOW = 16 * 1024   # Only drain once this much is still queued
+RX_BUFFER_SIZE = 131072  # Receive buffer owned by the protocol, reused for every read
 
 import asyncio
+import collections
 import logging
+import socket
 import struct
-from typing import Callable, Optional
+from enum import IntEnum
+from typing import Callable, Dict, Optional, Sequence
 
 from .const import (
     INTERCOM_PORT,
@@ -28,8 +33,163 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 
+# Frame header: type (u8), flags (u8), payload length (u16 LE)
+_HEADER = struct.Struct("<BBH")
+_EMPTY = b""  # Payload for control frames (no memoryview slice needed)
+
+# Payload-less control frames never change - pack them once
+_PING_FRAME = _HEADER.pack(MSG_PING, FLAG_NONE, 0)
+_PONG_FRAME = _HEADER.pack(MSG_PONG, FLAG_NONE, 0)
+_STOP_FRAME = _HEADER.pack(MSG_STOP, FLAG_NONE, 0)
+_START_FRAME = _HEADER.pack(MSG_START, FLAG_NONE, 0)
+_ANSWER_FRAME = _HEADER.pack(MSG_ANSWER, FLAG_NONE, 0)
+_CONTROL_FRAMES = {
+    MSG_PING: _PING_FRAME,
+    MSG_PONG: _PONG_FRAME,
+    MSG_STOP: _STOP_FRAME,
+    MSG_START: _START_FRAME,
+    MSG_ANSWER: _ANSWER_FRAME,
+}
+
+
+class _State(IntEnum):
+    """Connection state of the client (one value instead of several flags)."""
+
+    DISCONNECTED = 0
+    CONNECTED = 1  # Idle, no call
+    RINGING = 2    # ESP has auto_answer OFF, waiting for local answer
+    STREAMING = 3
+
+
+class IntercomProtocol(asyncio.BufferedProtocol):
+    """Receive side of the intercom connection.
+
+    The transport reads straight into a preallocated buffer (get_buffer/
+    buffer_updated - sock.recv_into() on the selector loop), so there is no
+    StreamReader copy and no second read for the payload. Every complete
+    frame is handed to the client as a memoryview into that buffer - only
+    valid until the handler returns.
+    """
+
+    def __init__(self, client: "IntercomTcpClient") -> None:
+        self._client = client
+        self._buf = bytearray(RX_BUFFER_SIZE)
+        self._mv = memoryview(self._buf)
+        self._read_pos = 0
+        self._write_pos = 0
+        # Wrap back to the start once 3/4 full, so every recv_into() gets at
+        # least a quarter of the buffer (the residual is always < one frame)
+        self._compact_mark = RX_BUFFER_SIZE * 3 // 4
+
+        loop = asyncio.get_running_loop()
+        self._loop = loop
+        self.transport: Optional[asyncio.Transport] = None
+        self.closed: asyncio.Future = loop.create_future()
+        self.last_rx = loop.time()
+        self.error: Optional[str] = None  # Set when we close the connection ourselves
+
+        # Write flow control (same idea as StreamWriter.drain)
+        self._paused = False
+        self._drain_waiters: collections.deque = collections.deque()
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport  # type: ignore[assignment]
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        if not self.closed.done():
+            self.closed.set_result(exc)
+        self._wake_drain(exc)
+
+    def eof_received(self) -> bool:
+        return False  # Close the transport on peer FIN
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        if self._write_pos >= self._compact_mark:
+            # Shift the residual partial frame back to the start of the buffer
+            pending = self._write_pos - self._read_pos
+            self._mv[:pending] = self._mv[self._read_pos:self._write_pos]
+            self._read_pos = 0
+            self._write_pos = pending
+        return self._mv[self._write_pos:]
+
+    def buffer_updated(self, nbytes: int) -> None:
+        """Dispatch every complete frame in the buffer before returning.
+
+        One TCP read often carries several frames; handling them all here
+        keeps event-loop wake-ups proportional to reads, not to frames.
+        """
+        write_pos = self._write_pos + nbytes
+        self._write_pos = write_pos
+        self.last_rx = self._loop.time()
+
+        buf = self._buf
+        mv = self._mv
+        handle = self._client._handle_message
+        transport = self.transport
+        pos = self._read_pos
+
+        while write_pos - pos >= HEADER_SIZE:
+            msg_type, flags, length = _HEADER.unpack_from(buf, pos)
+            if length > MAX_PAYLOAD_SIZE:
+                # Protocol desync - cannot recover, must disconnect
+                self.error = f"protocol desync: bad length {length} (max {MAX_PAYLOAD_SIZE})"
+                transport.close()
+                return
+            start = pos + HEADER_SIZE
+            end = start + length
+            if end > write_pos:
+                break  # Partial frame, wait for more data
+            pos = end
+            handle(msg_type, flags, mv[start:end] if length else _EMPTY)
+            if transport.is_closing():
+                return  # A handler tore the connection down
+
+        if pos == write_pos:
+            # Everything consumed - rewind for free instead of compacting later
+            self._read_pos = self._write_pos = 0
+        else:
+            self._read_pos = pos
+
+    # --- Write flow control ---
+
+    def pause_writing(self) -> None:
+        self._paused = True
+
+    def resume_writing(self) -> None:
+        self._paused = False
+        self._wake_drain(None)
+
+    def _wake_drain(self, exc: Optional[Exception]) -> None:
+        """Wake every pending drain() (there can be several concurrent senders)."""
+        for waiter in self._drain_waiters:
+            if not waiter.done():
+                if exc is None:
+                    waiter.set_result(None)
+                else:
+                    waiter.set_exception(exc)
+
+    async def drain(self) -> None:
+        """Wait until the transport write buffer is below the low-water mark."""
+        if self.closed.done():
+            raise ConnectionResetError("Connection lost")
+        if not self._paused:
+            return
+        waiter = self._loop.create_future()
+        self._drain_waiters.append(waiter)
+        try:
+            await waiter
+        finally:
+            self._drain_waiters.remove(waiter)
+        if self.closed.done():
+            raise ConnectionResetError("Connection lost")
+
+
 class IntercomTcpClient:
-    """Async TCP client for ESP intercom communication."""
+    """Async TCP client for ESP intercom communication.
+
+    on_audio receives a memoryview into the receive buffer. It is only valid
+    until the callback returns - copy it (bytes(data)) before queueing it.
+    """
 
     _instance_counter = 0
 
@@ -37,7 +197,7 @@ class IntercomTcpClient:
         self,
         host: str,
         port: int = INTERCOM_PORT,
-        on_audio: Optional[Callable[[bytes], None]] = None,
+        on_audio: Optional[Callable[[memoryview], None]] = None,
         on_disconnected: Optional[Callable[[], None]] = None,
         on_ringing: Optional[Callable[[], None]] = None,
         on_answered: Optional[Callable[[], None]] = None,
@@ -56,13 +216,10 @@ class IntercomTcpClient:
         self._on_stop_received = on_stop_received
         self._on_error_received = on_error_received
 
-        self._reader: Optional[asyncio.StreamReader] = None
-        self._writer: Optional[asyncio.StreamWriter] = None
-        self._connected = False
-        self._streaming = False
-        self._ringing = False  # ESP has auto_answer OFF, waiting for local answer
+        self._protocol: Optional[IntercomProtocol] = None
+        self._transport: Optional[asyncio.Transport] = None
+        self._state = _State.DISCONNECTED
         self._receive_task: Optional[asyncio.Task] = None
-        self._ping_task: Optional[asyncio.Task] = None
 
         # Flags to distinguish ACK PONG from keepalive PONG
         self._awaiting_start_ack = False   # Waiting for PONG/RING after START
@@ -72,24 +229,37 @@ class IntercomTcpClient:
         self._audio_recv = 0
         self._disconnect_notified = False
 
+        # Inbound message type -> handler (one dict lookup per frame)
+        self._dispatch: Dict[int, Callable[[int, memoryview], None]] = {
+            MSG_AUDIO: self._handle_audio,
+            MSG_PONG: self._handle_pong,
+            MSG_RING: self._handle_ring,
+            MSG_ANSWER: self._handle_answer,
+            MSG_STOP: self._handle_stop,
+            MSG_PING: self._handle_ping,
+            MSG_ERROR: self._handle_error,
+        }
+
         _LOGGER.debug("[TCP#%d] Created for %s:%d", self._instance_id, host, port)
 
     async def connect(self) -> bool:
-        if self._connected:
+        if self._state != _State.DISCONNECTED:
             return True
 
         try:
             _LOGGER.debug("[TCP#%d] Connecting to %s:%d...", self._instance_id, self.host, self.port)
-            self._reader, self._writer = await asyncio.wait_for(
-                asyncio.open_connection(self.host, self.port),
+            loop = asyncio.get_running_loop()
+            self._transport, self._protocol = await asyncio.wait_for(
+                loop.create_connection(lambda: IntercomProtocol(self), self.host, self.port),
                 timeout=CONNECT_TIMEOUT,
             )
-            self._connected = True
+            self._transport.set_write_buffer_limits(high=WRITE_BUFFER_HIGH, low=WRITE_BUFFER_LOW)
+            self._set_socket_options()
+            self._state = _State.CONNECTED
             self._disconnect_notified = False
             _LOGGER.debug("[TCP#%d] Connected", self._instance_id)
 
             self._receive_task = asyncio.create_task(self._receive_loop())
-            self._ping_task = asyncio.create_task(self._ping_loop())
 
             return True
 
@@ -100,12 +270,26 @@ class IntercomTcpClient:
             _LOGGER.error("[TCP#%d] Connection error: %s", self._instance_id, err)
             return False
 
+    def _set_socket_options(self) -> None:
+        """Low-latency socket options for small audio/control frames."""
+        sock = self._transport.get_extra_info("socket")
+        if sock is None:
+            return
+        try:
+            # asyncio already sets this on connect, but be explicit - Nagle
+            # coalescing adds up to 40ms to small frames
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # Linux only: ACK immediately on the receive side. The kernel may
+            # fall back to delayed ACKs later, so this mostly helps handshake/ping.
+            if hasattr(socket, "TCP_QUICKACK"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+        except OSError as err:
+            _LOGGER.debug("[TCP#%d] Could not set socket options: %s", self._instance_id, err)
+
     async def disconnect(self) -> None:
         _LOGGER.debug("[TCP#%d] Disconnecting", self._instance_id)
 
-        self._connected = False
-        self._streaming = False
-        self._ringing = False
+        self._state = _State.DISCONNECTED
 
         if self._receive_task:
             self._receive_task.cancel()
@@ -115,22 +299,14 @@ class IntercomTcpClient:
                 pass
             self._receive_task = None
 
-        if self._ping_task:
-            self._ping_task.cancel()
-            try:
-                await asyncio.wait_for(self._ping_task, timeout=1.0)
-            except (asyncio.CancelledError, asyncio.TimeoutError):
-                pass
-            self._ping_task = None
-
-        if self._writer:
+        if self._transport:
             try:
-                self._writer.close()
-                await asyncio.wait_for(self._writer.wait_closed(), timeout=1.0)
+                self._transport.close()
+                await asyncio.wait_for(asyncio.shield(self._protocol.closed), timeout=1.0)
             except Exception:
                 pass
-            self._writer = None
-            self._reader = None
+            self._transport = None
+            self._protocol = None
 
         if not self._disconnect_notified and self._on_disconnected:
             self._disconnect_notified = True
@@ -154,18 +330,17 @@ class IntercomTcpClient:
         _LOGGER.debug("[TCP#%d] start_stream(flags=0x%02X, caller=%s)",
                       self._instance_id, flags, caller_name or "(none)")
 
-        if not self._connected:
+        if self._state == _State.DISCONNECTED:
             if not await self.connect():
                 return "error"
 
         # Reset state before sending START
-        self._streaming = False
-        self._ringing = False
+        self._state = _State.CONNECTED
         self._awaiting_start_ack = True
         self._awaiting_answer_ack = False
 
         # Send START with caller_name as payload (for full mode)
-        payload = caller_name.encode("utf-8") if caller_name else b""
+        payload = caller_name.encode("utf-8") if caller_name else _EMPTY
         if not await self._send_message(MSG_START, data=payload, flags=flags):
             self._awaiting_start_ack = False
             return "error"
@@ -174,48 +349,50 @@ class IntercomTcpClient:
         # The actual state is set in _handle_message
         for _ in range(50):  # 500ms max wait
             await asyncio.sleep(0.01)
+            state = self._state
             # Check if connection was closed
-            if not self._connected:
+            if state == _State.DISCONNECTED:
                 _LOGGER.error("[TCP#%d] Connection lost while waiting for response", self._instance_id)
                 self._awaiting_start_ack = False
                 return "error"
-            if self._streaming:
+            if state == _State.STREAMING:
                 _LOGGER.debug("[TCP#%d] Stream started", self._instance_id)
                 return "streaming"
-            if self._ringing:
+            if state == _State.RINGING:
                 _LOGGER.debug("[TCP#%d] ESP ringing", self._instance_id)
                 return "ringing"
 
         # Timeout - check if still connected before assuming streaming
-        if not self._connected:
+        if self._state == _State.DISCONNECTED:
             _LOGGER.error("[TCP#%d] Connection lost, cannot start stream", self._instance_id)
             self._awaiting_start_ack = False
             return "error"
 
         # Still connected but no response - assume old ESP that doesn't send response
         self._awaiting_start_ack = False
-        self._streaming = True
+        self._state = _State.STREAMING
         _LOGGER.warning("[TCP#%d] No response, assuming stream started", self._instance_id)
         return "streaming"
 
     @property
     def is_ringing(self) -> bool:
         """Return True if ESP is ringing (auto_answer OFF)."""
-        return self._ringing
+        return self._state == _State.RINGING
 
     @property
     def is_streaming(self) -> bool:
         """Return True if actively streaming."""
-        return self._streaming
+        return self._state == _State.STREAMING
 
     async def stop_stream(self) -> None:
         _LOGGER.debug("[TCP#%d] stop_stream()", self._instance_id)
 
         # First stop accepting new audio
-        self._streaming = False
+        if self._state == _State.STREAMING:
+            self._state = _State.CONNECTED
 
         # Try to send STOP but don't block forever
-        if self._connected and self._writer:
+        if self._state != _State.DISCONNECTED and self._transport:
             try:
                 await asyncio.wait_for(self._send_message(MSG_STOP), timeout=1.0)
                 _LOGGER.debug("[TCP#%d] STOP sent", self._instance_id)
@@ -228,10 +405,10 @@ class IntercomTcpClient:
         """Send ANSWER to ESP (for remote answer from card when ESP is ringing)."""
         _LOGGER.debug("[TCP#%d] send_answer()", self._instance_id)
 
-        if not self._connected or not self._writer:
+        if self._state == _State.DISCONNECTED or not self._transport:
             return False
 
-        if not self._ringing:
+        if self._state != _State.RINGING:
             _LOGGER.warning("[TCP#%d] send_answer() but not ringing", self._instance_id)
             return False
 
@@ -253,71 +430,136 @@ class IntercomTcpClient:
             return False
 
     async def send_audio(self, data: bytes) -> bool:
-        """Send audio data - drain periodically to avoid blocking."""
-        if not self._connected or not self._streaming or not self._writer:
-            return False
+        """Send one audio chunk (see send_audio_frames)."""
+        return await self.send_audio_frames((data,))
 
-        self._audio_sent += 1
+    async def send_audio_frames(self, frames: Sequence[bytes]) -> bool:
+        """Send several queued audio chunks with a single writelines() call.
 
-        try:
-            header = struct.pack("<BBH", MSG_AUDIO, FLAG_NONE, len(data))
-            self._writer.write(header + data)
+        Chunks larger than MAX_PAYLOAD_SIZE are split into several frames
+        (memoryview slices, no copy) - the 16-bit length field would
+        otherwise wrap and the ESP would lose sync.
+        """
+        # STREAMING implies a live transport (it is cleared before the transport)
+        if self._state != _State.STREAMING:
+            return False
 
-            # Drain periodically to avoid blocking on every packet
-            if self._audio_sent % DRAIN_INTERVAL == 0:
-                try:
-                    await asyncio.wait_for(self._writer.drain(), timeout=0.1)
-                except asyncio.TimeoutError:
-                    pass  # TCP congestion - continue anyway
+        try:
+            segments = []
+            for data in frames:
+                length = len(data)
+                if length <= MAX_PAYLOAD_SIZE:
+                    segments.append(_HEADER.pack(MSG_AUDIO, FLAG_NONE, length))
+                    segments.append(data)
+                    continue
+                view = memoryview(data)
+                for offset in range(0, length, MAX_PAYLOAD_SIZE):
+                    chunk = view[offset:offset + MAX_PAYLOAD_SIZE]
+                    segments.append(_HEADER.pack(MSG_AUDIO, FLAG_NONE, len(chunk)))
+                    segments.append(chunk)
+            self._audio_sent += len(segments) // 2
+            self._transport.writelines(segments)
+            await self._drain_audio()
             return True
         except Exception as err:
             _LOGGER.error("[TCP#%d] Audio send error: %s", self._instance_id, err)
             return False
 
-    async def _send_message(self, msg_type: int, data: bytes = b"", flags: int = FLAG_NONE) -> bool:
-        """Send control message with drain (blocking)."""
-        if not self._writer:
+    async def _drain_audio(self) -> None:
+        # Backpressure: only wait when the peer isn't keeping up
+        if self._transport.get_write_buffer_size() > WRITE_BUFFER_LOW:
+            try:
+                await asyncio.wait_for(self._protocol.drain(), timeout=0.1)
+            except asyncio.TimeoutError:
+                pass  # TCP congestion - continue anyway
+
+    async def _send_message(self, msg_type: int, data: bytes = _EMPTY, flags: int = FLAG_NONE) -> bool:
+        """Send control message, draining if the write buffer is backing up."""
+        if not self._write_message(msg_type, data, flags):
             return False
 
         try:
-            header = struct.pack("<BBH", msg_type, flags, len(data))
-            self._writer.write(header + data)
-            await self._writer.drain()
+            if self._transport.get_write_buffer_size() > WRITE_BUFFER_LOW:
+                await self._protocol.drain()
             return True
         except Exception as err:
             _LOGGER.error("[TCP#%d] Send error: %s", self._instance_id, err)
             return False
 
+    def _write_message(self, msg_type: int, data: bytes = _EMPTY, flags: int = FLAG_NONE) -> bool:
+        """Queue a message on the transport without waiting for drain."""
+        if not self._transport or self._transport.is_closing():
+            return False
+
+        if len(data) > MAX_PAYLOAD_SIZE:
+            _LOGGER.error("[TCP#%d] Payload too large for message 0x%02X: %d bytes (max %d)",
+                          self._instance_id, msg_type, len(data), MAX_PAYLOAD_SIZE)
+            return False
+
+        if not data and flags == FLAG_NONE:
+            frame = _CONTROL_FRAMES.get(msg_type)
+            if frame is not None:
+                self._transport.write(frame)
+                return True
+
+        self._write_frame(msg_type, flags, data)
+        return True
+
+    def _write_frame(self, msg_type: int, flags: int, data: bytes) -> None:
+        """Write header and payload as two segments (no concat copy).
+
+        On Python 3.12+ the selector transport sends both with one sendmsg().
+        """
+        header = _HEADER.pack(msg_type, flags, len(data))
+        if data:
+            self._transport.writelines((header, data))
+        else:
+            self._transport.write(header)
+
     async def _receive_loop(self) -> None:
+        """Watch the connection and send keepalive pings.
+
+        Frames are parsed by IntercomProtocol; this task only tracks the
+        read timeout and the ping deadline, so one task owns the connection.
+        """
         _LOGGER.debug("[TCP#%d] Receive loop started", self._instance_id)
+        protocol = self._protocol
+        loop = asyncio.get_running_loop()
+        next_ping = loop.time() + PING_INTERVAL
         try:
-            while self._connected and self._reader:
+            while self._state != _State.DISCONNECTED and protocol:
+                now = loop.time()
+                if now >= next_ping:
+                    # Don't ping during streaming or ringing:
+                    # - Streaming: TCP already detects dead connections, ping interferes with audio
+                    # - Ringing: PONG response would be confused with answer ACK
+                    if self._state == _State.CONNECTED:
+                        self._write_message(MSG_PING)
+                    next_ping = now + PING_INTERVAL
+
                 # Timeout detects dead connections (ESP crash without TCP FIN)
                 # Idle: ping every 30s, so 60s is safe. Streaming: audio every 16ms, 5s is generous.
-                read_timeout = 5.0 if self._streaming else 60.0
-                header_data = await asyncio.wait_for(
-                    self._reader.readexactly(HEADER_SIZE), timeout=read_timeout
-                )
-                msg_type, flags, length = struct.unpack("<BBH", header_data)
-
-                payload = b""
-                if length > 0:
-                    if length > MAX_PAYLOAD_SIZE:
-                        # Protocol desync - cannot recover, must disconnect
-                        _LOGGER.error("[TCP#%d] Protocol desync: bad length %d (max %d), closing",
-                                     self._instance_id, length, MAX_PAYLOAD_SIZE)
-                        raise ConnectionError("protocol desync")
-                    payload = await asyncio.wait_for(
-                        self._reader.readexactly(length), timeout=read_timeout
+                read_timeout = 5.0 if self._state == _State.STREAMING else 60.0
+                remaining = protocol.last_rx + read_timeout - now
+                if remaining <= 0:
+                    raise asyncio.TimeoutError
+                try:
+                    exc = await asyncio.wait_for(
+                        asyncio.shield(protocol.closed), timeout=min(remaining, next_ping - now)
                     )
+                except asyncio.TimeoutError:
+                    continue  # Ping due, or re-check against the latest receive time
 
-                await self._handle_message(msg_type, flags, payload)
+                if protocol.error:
+                    raise ConnectionError(protocol.error)
+                if exc is not None:
+                    raise exc
+                _LOGGER.info("[TCP#%d] Connection closed by peer", self._instance_id)
+                break
 
         except asyncio.TimeoutError:
             _LOGGER.warning("[TCP#%d] Read timeout (streaming=%s) - connection dead",
-                           self._instance_id, self._streaming)
-        except asyncio.IncompleteReadError:
-            _LOGGER.info("[TCP#%d] Connection closed by peer", self._instance_id)
+                           self._instance_id, self._state == _State.STREAMING)
         except asyncio.CancelledError:
             _LOGGER.debug("[TCP#%d] Receive loop cancelled", self._instance_id)
         except ConnectionError as err:
@@ -326,84 +568,81 @@ class IntercomTcpClient:
             _LOGGER.error("[TCP#%d] Receive error: %s", self._instance_id, err)
         finally:
             # Mark as disconnected so other parts know the connection is dead
-            self._connected = False
-            self._streaming = False
+            self._state = _State.DISCONNECTED
+            if protocol and protocol.transport and not protocol.transport.is_closing():
+                protocol.transport.close()
             if not self._disconnect_notified and self._on_disconnected:
                 self._disconnect_notified = True
                 self._on_disconnected()
 
-    async def _handle_message(self, msg_type: int, flags: int, payload: bytes) -> None:
-        if msg_type == MSG_AUDIO:
-            self._audio_recv += 1
-            if self._on_audio:
-                self._on_audio(payload)
-
-        elif msg_type == MSG_PONG:
-            # PONG can be:
-            # 1. ACK for START (auto_answer ON) - we set _awaiting_start_ack
-            # 2. ACK for ANSWER - we set _awaiting_answer_ack
-            # 3. Keepalive response - neither flag set, IGNORE
-            if self._awaiting_answer_ack:
-                _LOGGER.debug("[TCP#%d] PONG - answer confirmed", self._instance_id)
-                self._awaiting_answer_ack = False
-                self._awaiting_start_ack = False
-                self._ringing = False
-                self._streaming = True
-                if self._on_answered:
-                    self._on_answered()
-            elif self._awaiting_start_ack:
-                _LOGGER.debug("[TCP#%d] PONG - stream accepted (auto_answer ON)", self._instance_id)
-                self._awaiting_start_ack = False
-                self._streaming = True
-            else:
-                # Keepalive PONG - do NOT change state
-                _LOGGER.debug("[TCP#%d] PONG - keepalive (ignored)", self._instance_id)
-
-        elif msg_type == MSG_RING:
-            _LOGGER.debug("[TCP#%d] RING received", self._instance_id)
-            # RING means ESP has auto_answer OFF - not a PONG for START
-            self._awaiting_start_ack = False
-            self._ringing = True
-            if self._on_ringing:
-                self._on_ringing()
-
-        elif msg_type == MSG_ANSWER:
-            # ANSWER from ESP (local GPIO answer) - not via our send_answer()
-            _LOGGER.debug("[TCP#%d] ANSWER received from ESP", self._instance_id)
+    def _set_state(self, state: _State) -> None:
+        """State change from an ESP message - never revives a closed client."""
+        if self._state != _State.DISCONNECTED:
+            self._state = state
+
+    def _handle_message(self, msg_type: int, flags: int, payload: memoryview) -> None:
+        """Dispatch one frame (called synchronously from IntercomProtocol)."""
+        handler = self._dispatch.get(msg_type)
+        if handler is not None:
+            handler(flags, payload)
+        else:
+            _LOGGER.debug("[TCP#%d] Unknown message type 0x%02X (ignored)", self._instance_id, msg_type)
+
+    def _handle_audio(self, flags: int, payload: memoryview) -> None:
+        self._audio_recv += 1
+        if self._on_audio:
+            self._on_audio(payload)
+
+    def _handle_pong(self, flags: int, payload: memoryview) -> None:
+        # PONG can be:
+        # 1. ACK for START (auto_answer ON) - we set _awaiting_start_ack
+        # 2. ACK for ANSWER - we set _awaiting_answer_ack
+        # 3. Keepalive response - neither flag set, IGNORE
+        if self._awaiting_answer_ack:
+            _LOGGER.debug("[TCP#%d] PONG - answer confirmed", self._instance_id)
             self._awaiting_answer_ack = False
             self._awaiting_start_ack = False
-            self._ringing = False
-            self._streaming = True
+            self._set_state(_State.STREAMING)
             if self._on_answered:
                 self._on_answered()
+        elif self._awaiting_start_ack:
+            _LOGGER.debug("[TCP#%d] PONG - stream accepted (auto_answer ON)", self._instance_id)
+            self._awaiting_start_ack = False
+            self._set_state(_State.STREAMING)
+        else:
+            # Keepalive PONG - do NOT change state
+            _LOGGER.debug("[TCP#%d] PONG - keepalive (ignored)", self._instance_id)
+
+    def _handle_ring(self, flags: int, payload: memoryview) -> None:
+        _LOGGER.debug("[TCP#%d] RING received", self._instance_id)
+        # RING means ESP has auto_answer OFF - not a PONG for START
+        self._awaiting_start_ack = False
+        self._set_state(_State.RINGING)
+        if self._on_ringing:
+            self._on_ringing()
 
-        elif msg_type == MSG_STOP:
-            _LOGGER.debug("[TCP#%d] STOP received from ESP", self._instance_id)
-            self._streaming = False
-            self._ringing = False
-            if self._on_stop_received:
-                self._on_stop_received()
-
-        elif msg_type == MSG_PING:
-            _LOGGER.debug("[TCP#%d] PING -> PONG", self._instance_id)
-            await self._send_message(MSG_PONG)
-
-        elif msg_type == MSG_ERROR:
-            error_code = payload[0] if payload else 0
-            _LOGGER.error("[TCP#%d] ERROR from ESP: code=%d", self._instance_id, error_code)
-            self._streaming = False
-            self._ringing = False
-            if self._on_error_received:
-                self._on_error_received(error_code)
-
-    async def _ping_loop(self) -> None:
-        try:
-            while self._connected:
-                await asyncio.sleep(PING_INTERVAL)
-                # Don't ping during streaming or ringing:
-                # - Streaming: TCP already detects dead connections, ping interferes with audio
-                # - Ringing: PONG response would be confused with answer ACK
-                if self._connected and not self._streaming and not self._ringing:
-                    await self._send_message(MSG_PING)
-        except asyncio.CancelledError:
-            pass
+    def _handle_answer(self, flags: int, payload: memoryview) -> None:
+        # ANSWER from ESP (local GPIO answer) - not via our send_answer()
+        _LOGGER.debug("[TCP#%d] ANSWER received from ESP", self._instance_id)
+        self._awaiting_answer_ack = False
+        self._awaiting_start_ack = False
+        self._set_state(_State.STREAMING)
+        if self._on_answered:
+            self._on_answered()
+
+    def _handle_stop(self, flags: int, payload: memoryview) -> None:
+        _LOGGER.debug("[TCP#%d] STOP received from ESP", self._instance_id)
+        self._set_state(_State.CONNECTED)
+        if self._on_stop_received:
+            self._on_stop_received()
+
+    def _handle_ping(self, flags: int, payload: memoryview) -> None:
+        _LOGGER.debug("[TCP#%d] PING -> PONG", self._instance_id)
+        self._write_message(MSG_PONG)
+
+    def _handle_error(self, flags: int, payload: memoryview) -> None:
+        error_code = payload[0] if payload else 0
+        _LOGGER.error("[TCP#%d] ERROR from ESP: code=%d", self._instance_id, error_code)
+        self._set_state(_State.CONNECTED)
+        if self._on_error_received:
+            self._on_error_received(error_code)
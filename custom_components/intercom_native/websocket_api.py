@@ -1,17 +1,21 @@
 """WebSocket API for Intercom Native integration."""
 
 import asyncio
-import base64
+import binascii
 import logging
 from typing import Any, Dict, Optional
 
 # Audio queue config
 AUDIO_QUEUE_SIZE = 8  # Max pending audio chunks - drop old if full
+AUDIO_BATCH_FRAMES = 4  # ESP->browser: frames merged into one intercom_audio event
+AUDIO_BATCH_DELAY = 0.02  # ...or flush after this long (bounds added latency)
 
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
 
 from .const import (
     DOMAIN,
@@ -38,6 +42,31 @@ _sessions: Dict[str, "IntercomSession"] = {}
 _bridges: Dict[str, "BridgeSession"] = {}
 
 
+def _put_drop_oldest(queue: asyncio.Queue, data: bytes) -> None:
+    """Queue audio without blocking - if full, drop the oldest chunk.
+
+    Keeps the newest audio so latency stays bounded by the queue size.
+    """
+    try:
+        queue.put_nowait(data)
+    except asyncio.QueueFull:
+        try:
+            queue.get_nowait()
+        except asyncio.QueueEmpty:
+            pass
+        queue.put_nowait(data)
+
+
+def _take_pending(queue: asyncio.Queue, first: bytes) -> list:
+    """Collect everything already queued behind `first` (no waiting)."""
+    frames = [first]
+    while True:
+        try:
+            frames.append(queue.get_nowait())
+        except asyncio.QueueEmpty:
+            return frames
+
+
 class IntercomSession:
     """Manages a single intercom session between browser and ESP."""
 
@@ -58,19 +87,47 @@ class IntercomSession:
         self._tx_queue: asyncio.Queue = asyncio.Queue(maxsize=AUDIO_QUEUE_SIZE)
         self._tx_task: Optional[asyncio.Task] = None
 
+        # ESP->browser audio batching (one event per few frames)
+        self._audio_batch = bytearray()
+        self._audio_batch_frames = 0
+        self._audio_flush_handle: Optional[asyncio.TimerHandle] = None
+
+        # (connection, msg_id) of the close-cleanup subscription, if any
+        self._ws_subscription: Optional[tuple] = None
+
     # --- Callbacks for TCP client (shared by start() and answer_esp_call()) ---
 
-    def _on_audio(self, data: bytes) -> None:
-        """Handle audio from ESP - fire event to browser."""
+    def _on_audio(self, data: memoryview) -> None:
+        """Handle audio from ESP - batch frames, then fire event to browser."""
         if not self._active:
             return
-        self.hass.bus.async_fire(
-            "intercom_audio",
-            {
-                "device_id": self.device_id,
-                "audio": base64.b64encode(data).decode("ascii"),
-            }
-        )
+        self._audio_batch += data  # Copies out of the TCP receive buffer
+        self._audio_batch_frames += 1
+        if self._audio_batch_frames >= AUDIO_BATCH_FRAMES:
+            self._flush_audio()
+        elif self._audio_flush_handle is None:
+            self._audio_flush_handle = self.hass.loop.call_later(
+                AUDIO_BATCH_DELAY, self._flush_audio
+            )
+
+    def _flush_audio(self) -> None:
+        """Fire one intercom_audio event with all batched frames."""
+        if self._audio_flush_handle is not None:
+            self._audio_flush_handle.cancel()
+            self._audio_flush_handle = None
+        if not self._audio_batch:
+            return
+        if self._active:
+            # b2a_base64 is what b64encode wraps - skip the Python-level wrapper
+            self.hass.bus.async_fire(
+                "intercom_audio",
+                {
+                    "device_id": self.device_id,
+                    "audio": binascii.b2a_base64(self._audio_batch, newline=False).decode("ascii"),
+                }
+            )
+        self._audio_batch.clear()
+        self._audio_batch_frames = 0
 
     def _on_disconnected(self) -> None:
         self._active = False
@@ -119,16 +176,19 @@ class IntercomSession:
         )
 
     def _create_tcp_client(self) -> IntercomTcpClient:
-        """Create a TCP client with standard callbacks."""
+        """Create a TCP client with standard callbacks.
+
+        Bound methods are passed directly - no extra lambda frame per audio frame.
+        """
         return IntercomTcpClient(
             host=self.host,
             port=INTERCOM_PORT,
-            on_audio=lambda data: self._on_audio(data),
-            on_disconnected=lambda: self._on_disconnected(),
-            on_ringing=lambda: self._on_ringing(),
-            on_answered=lambda: self._on_answered(),
-            on_stop_received=lambda: self._on_stop_received(),
-            on_error_received=lambda code: self._on_error_received(code),
+            on_audio=self._on_audio,
+            on_disconnected=self._on_disconnected,
+            on_ringing=self._on_ringing,
+            on_answered=self._on_answered,
+            on_stop_received=self._on_stop_received,
+            on_error_received=self._on_error_received,
         )
 
     async def start(self) -> str:
@@ -177,6 +237,9 @@ class IntercomSession:
         """Stop the intercom session."""
         self._active = False
         self._ringing = False
+        self._flush_audio()  # Drops pending audio (session no longer active)
+
+        self._release_ws_subscription()
 
         # Fire "idle" state - call ended
         self.hass.bus.async_fire(
@@ -200,6 +263,13 @@ class IntercomSession:
             await self._tcp_client.disconnect()
             self._tcp_client = None
 
+    def _release_ws_subscription(self) -> None:
+        """Remove the close-cleanup subscription (it holds a reference to us)."""
+        if self._ws_subscription:
+            connection, msg_id = self._ws_subscription
+            self._ws_subscription = None
+            connection.subscriptions.pop(msg_id, None)
+
     async def answer(self) -> bool:
         """Answer a ringing call (send ANSWER to ESP).
 
@@ -261,23 +331,23 @@ class IntercomSession:
             return "error"
 
     async def _tx_sender(self) -> None:
-        """Single task that sends audio from queue to TCP."""
+        """Single task that sends audio from queue to TCP.
+
+        Chunks that piled up while we were waiting go out in one write.
+        """
         try:
             while self._active and self._tcp_client:
                 data = await self._tx_queue.get()
-                await self._tcp_client.send_audio(data)
+                await self._tcp_client.send_audio_frames(_take_pending(self._tx_queue, data))
         except asyncio.CancelledError:
             pass
 
     def queue_audio(self, data: bytes) -> None:
-        """Queue audio for sending - drops if full (non-blocking)."""
+        """Queue audio for sending - drops oldest if full (non-blocking)."""
         if not self._active:
             return
 
-        try:
-            self._tx_queue.put_nowait(data)
-        except asyncio.QueueFull:
-            pass  # Drop silently - low latency > perfect audio
+        _put_drop_oldest(self._tx_queue, data)  # Low latency > perfect audio
 
 
 class BridgeSession:
@@ -323,13 +393,6 @@ class BridgeSession:
         # Stop lock to prevent race conditions
         self._stop_lock = asyncio.Lock()
 
-    def _push_audio(self, queue: asyncio.Queue, data: bytes) -> None:
-        """Push audio to queue, dropping if full (non-blocking)."""
-        try:
-            queue.put_nowait(data)
-        except asyncio.QueueFull:
-            pass  # Drop silently - low latency > perfect audio
-
     async def _sender_loop(
         self,
         queue: asyncio.Queue,
@@ -344,7 +407,7 @@ class BridgeSession:
                     # Wait for audio with timeout to allow checking _active
                     data = await asyncio.wait_for(queue.get(), timeout=1.0)
                     if self._active and client:
-                        await client.send_audio(data)
+                        await client.send_audio_frames(_take_pending(queue, data))
                 except asyncio.TimeoutError:
                     continue  # Check _active and loop
         except asyncio.CancelledError:
@@ -368,15 +431,18 @@ class BridgeSession:
             return "connected"
 
         bridge = self
+        q_source_to_dest = self._q_source_to_dest
+        q_dest_to_source = self._q_dest_to_source
 
         # Audio callbacks now push to queue instead of creating tasks
-        def on_source_audio(data: bytes) -> None:
+        # (copied - the memoryview is only valid during the callback)
+        def on_source_audio(data: memoryview) -> None:
             if bridge._active:
-                bridge._push_audio(bridge._q_source_to_dest, data)
+                _put_drop_oldest(q_source_to_dest, bytes(data))
 
-        def on_dest_audio(data: bytes) -> None:
+        def on_dest_audio(data: memoryview) -> None:
             if bridge._active:
-                bridge._push_audio(bridge._q_dest_to_source, data)
+                _put_drop_oldest(q_dest_to_source, bytes(data))
 
         def on_source_disconnected() -> None:
             _LOGGER.debug("Bridge source disconnected: %s", bridge.bridge_id)
@@ -593,6 +659,7 @@ async def websocket_start(
 
     _LOGGER.debug("Start request: device=%s host=%s", device_id, host)
 
+    session = None
     try:
         # Stop existing session if any
         if device_id in _sessions:
@@ -600,9 +667,14 @@ async def websocket_start(
             await old_session.stop()
 
         session = IntercomSession(hass=hass, device_id=device_id, host=host)
+        # Before start(): the browser may go away while we are connecting
+        _register_session_cleanup(hass, connection, msg_id, session)
         result = await session.start()
 
-        if result == "streaming":
+        if result != "error" and session._ws_subscription is None:
+            _LOGGER.debug("WebSocket closed during start, stopping session: %s", device_id)
+            await session.stop()
+        elif result == "streaming":
             _sessions[device_id] = session
             _LOGGER.debug("Session started (streaming): %s", device_id)
             connection.send_result(msg_id, {"success": True, "state": "streaming"})
@@ -611,13 +683,43 @@ async def websocket_start(
             _LOGGER.debug("Session started (ringing): %s", device_id)
             connection.send_result(msg_id, {"success": True, "state": "ringing"})
         else:
+            session._release_ws_subscription()
             _LOGGER.error("Session failed: %s", device_id)
             connection.send_error(msg_id, "connection_failed", f"Failed to connect to {host}")
     except Exception as err:
+        if session:
+            session._release_ws_subscription()
         _LOGGER.exception("Start exception: %s", err)
         connection.send_error(msg_id, "exception", str(err))
 
 
+def _register_session_cleanup(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg_id: int,
+    session: IntercomSession,
+) -> None:
+    """Stop the session if the browser's WebSocket closes without a stop command.
+
+    HA calls every connection subscription when the connection goes away.
+    Registered before the session starts; any other way the session ends
+    removes the subscription again (IntercomSession.stop()).
+    """
+    @callback
+    def _async_connection_closed() -> None:
+        # HA is iterating connection.subscriptions and clears it afterwards -
+        # stop() must not pop from it. This also tells a still-running start
+        # that the browser is gone.
+        session._ws_subscription = None
+        if _sessions.get(session.device_id) is session:
+            _LOGGER.debug("WebSocket closed, stopping session: %s", session.device_id)
+            _sessions.pop(session.device_id)
+            hass.async_create_task(session.stop())
+
+    connection.subscriptions[msg_id] = _async_connection_closed
+    session._ws_subscription = (connection, msg_id)
+
+
 async def _stop_device_sessions(device_id: str) -> bool:
     """Stop all sessions and bridges involving a device.
 
@@ -735,6 +837,7 @@ async def websocket_answer_esp_call(
 
     _LOGGER.debug("Answer ESP call: device=%s host=%s", device_id, host)
 
+    session = None
     try:
         # Stop existing session if any
         if device_id in _sessions:
@@ -742,16 +845,24 @@ async def websocket_answer_esp_call(
             await old_session.stop()
 
         session = IntercomSession(hass=hass, device_id=device_id, host=host)
+        # Before answering: the browser may go away while we are connecting
+        _register_session_cleanup(hass, connection, msg_id, session)
         result = await session.answer_esp_call()
 
-        if result == "streaming":
+        if result == "streaming" and session._ws_subscription is None:
+            _LOGGER.debug("WebSocket closed while answering, stopping session: %s", device_id)
+            await session.stop()
+        elif result == "streaming":
             _sessions[device_id] = session
             _LOGGER.info("Answered ESP call (streaming): %s", device_id)
             connection.send_result(msg_id, {"success": True, "state": "streaming"})
         else:
+            session._release_ws_subscription()
             _LOGGER.error("Failed to answer ESP call: %s", device_id)
             connection.send_error(msg_id, "connection_failed", f"Failed to connect to {host}")
     except Exception as err:
+        if session:
+            session._release_ws_subscription()
         _LOGGER.exception("Answer ESP call exception: %s", err)
         connection.send_error(msg_id, "exception", str(err))
 
@@ -778,7 +889,7 @@ def websocket_audio(
         return
 
     try:
-        session.queue_audio(base64.b64decode(audio_b64))
+        session.queue_audio(binascii.a2b_base64(audio_b64))
     except Exception:
         pass
 
@@ -805,22 +916,21 @@ async def websocket_list_devices(
 
 async def _get_intercom_devices(hass: HomeAssistant) -> list:
     """Get all intercom devices with their info."""
-    from homeassistant.helpers import entity_registry as er
-    from homeassistant.helpers import device_registry as dr
-
     devices = []
     entity_registry = er.async_get(hass)
     device_registry = dr.async_get(hass)
+    get_device = device_registry.async_get
 
     # Find devices that have intercom_state sensor (indicates intercom_api component)
-    intercom_device_ids = set()
-    for entity in entity_registry.entities.values():
-        if "intercom_state" in entity.entity_id:
-            intercom_device_ids.add(entity.device_id)
+    intercom_device_ids = {
+        entity.device_id
+        for entity in entity_registry.entities.values()
+        if "intercom_state" in entity.entity_id
+    }
 
     # Get device info and IP for each intercom device
     for device_id in intercom_device_ids:
-        device = device_registry.async_get(device_id)
+        device = get_device(device_id)
         if not device:
             continue
 
@@ -849,10 +959,11 @@ async def _get_intercom_devices(hass: HomeAssistant) -> list:
         # Only add devices with valid IP
         if ip_address:
             # Collect entity IDs for this device (for card to use without admin perms)
+            # Uses the registry's device index instead of rescanning every entity
             entities = {}
-            for entity in entity_registry.entities.values():
-                if entity.device_id != device_id:
-                    continue
+            for entity in er.async_entries_for_device(
+                entity_registry, device_id, include_disabled_entities=True
+            ):
                 eid = entity.entity_id
                 if "intercom_state" in eid and "intercom_state" not in entities:
                     entities["intercom_state"] = eid
@@ -1027,9 +1138,6 @@ async def start_auto_bridge(hass: HomeAssistant, intercom_state_entity_id: str)
     Called from sensor.py when an ESP's intercom_state changes to 'outgoing'.
     This enables ESP button-initiated calls without needing the card.
     """
-    from homeassistant.helpers import entity_registry as er
-    from homeassistant.helpers import device_registry as dr
-
     _LOGGER.info("Auto-bridge: processing call from %s", intercom_state_entity_id)
 
     entity_registry = er.async_get(hass)
@@ -1068,11 +1176,12 @@ async def start_auto_bridge(hass: HomeAssistant, intercom_state_entity_id: str)
     # Find destination sensor for this device (sensor.XXX_dest or sensor.XXX_destination)
     dest_entity_id = None
     destination_name = None
-    for entity in entity_registry.entities.values():
-        if entity.device_id == source_device_id:
-            if "destination" in entity.entity_id or "_dest" in entity.entity_id:
-                dest_entity_id = entity.entity_id
-                break
+    for entity in er.async_entries_for_device(
+        entity_registry, source_device_id, include_disabled_entities=True
+    ):
+        if "destination" in entity.entity_id or "_dest" in entity.entity_id:
+            dest_entity_id = entity.entity_id
+            break
 
     if dest_entity_id:
         dest_state = hass.states.get(dest_entity_id)